@@ -5,7 +5,7 @@ from psiqworkbench import resource_estimator
 
 from .ppr.ppr import PPR
 from .jw_transform.hamiltonian import SYK_hamil
-from .trotter.trotter import second_order_trotter
+from .trotter.trotter import second_order_trotter, second_order_rotation_count
 from .qdrift.qdrift import qdrift
 from workbench_algorithms.utils import pauli_sum_to_numpy
 import json
@@ -41,7 +41,7 @@ def run_comparison():
     second_order_trotter(ham, qubits_t, ppr, time, trotter_steps)
     ## extract final unitary matrix for trotter
     trotter_u = qpu_t.get_filter_by_name(">>unitary>>").get()
-    trotter_gates = 2 * num_terms * trotter_steps
+    trotter_gates = second_order_rotation_count(ham, trotter_steps)
 
     qpu_q = QPU(num_qubits=n_qubits, filters=">>unitary>>")
     qubits_q = Qubits(qpu=qpu_q, num_qubits=n_qubits)
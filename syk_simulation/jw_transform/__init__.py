@@ -1 +1 @@
-from .hamiltonian import SYK_hamil
\ No newline at end of file
+from .hamiltonian import SYK_hamil, SYK_hamil_stream, pauli_mul_phase
\ No newline at end of file
@@ -1,8 +1,84 @@
 from workbench_algorithms.utils import PauliMask, PauliSum 
-from math import floor 
-from itertools import combinations
+from itertools import combinations, islice
 import numpy as np
 
+def _range_mask(a: int, b: int):
+    """
+    Bitmask with all bits strictly between a and b set (a < b)
+    """
+    return 0 if b <= a+1 else (1 << b) - (1 << (a+1))
+
+#Number of set bits of every byte value
+_BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+def _popcount(masks: int | np.ndarray):
+    """
+    Number of set bits of a non-negative integer mask, or of every entry of a 1d array of masks
+    """
+    if not isinstance(masks, np.ndarray):
+        return masks.bit_count()
+    if masks.dtype == object:
+        return np.array([mask.bit_count() for mask in masks], dtype=np.int64)
+    return _BYTE_POPCOUNT[masks.view(np.uint8)].reshape(len(masks), -1).sum(axis=1, dtype=np.int64)
+
+def pauli_mul_phase(x1: int, z1: int, x2: int, z2: int):
+    """
+    Power of 1j picked up by the product of two Pauli strings given as masks (with Y = 1j*X*Z),
+    i.e. P(x1,z1)*P(x2,z2) = 1j**k * P(x1^x2, z1^z2). Also accepts arrays of masks.
+
+    :param x1: x mask of the first Pauli string
+    :type x1: int
+
+    :param z1: z mask of the first Pauli string
+    :type z1: int
+
+    :param x2: x mask of the second Pauli string
+    :type x2: int
+
+    :param z2: z mask of the second Pauli string
+    :type z2: int
+
+    Output: Power k of 1j in 0..3
+    """
+    return (_popcount(x1 & z1) + _popcount(x2 & z2) - _popcount((x1 ^ x2) & (z1 ^ z2)) + 2*_popcount(z1 & x2)) & 3
+
+def _pair_masks(p: int, q: int):
+    """
+    JW transform of the product of two majorana fermions as integer masks
+
+    :param p: Index for the first majorana fermion
+    :type p: int
+
+    :param q: Index for the second majorana fermion
+    :type q: int
+
+    Output: Tuple with sign (+-1), power of 1j, x mask and z mask. The coefficient is sign*1j**i_power
+    """
+    #Cast to python integers so that masks of numpy indices cannot overflow
+    p, q = int(p), int(q)
+
+    #Order the majoranas, swapping them flips the sign of the product
+    swap_sign = 1
+    if p > q:
+        p, q = q, p
+        swap_sign = -1
+
+    hp = p >> 1
+    hq = q >> 1
+
+    #Both majoranas act on the same qubit
+    if hq == hp:
+        return swap_sign, 1, 0, 1 << hq
+
+    x_mask = (1 << hp) | (1 << hq)
+    z_mask = _range_mask(hp, hq)
+    if q & 1:
+        z_mask |= 1 << hq
+    if p & 1:
+        return swap_sign, 1, x_mask, z_mask
+    z_mask |= 1 << hp
+    return -swap_sign, 1, x_mask, z_mask
+
 def SYK_pair_to_mask(p: int, q: int):
     """
     Function generating the PauliString for the product of two majorana fermions
@@ -15,38 +91,82 @@ def SYK_pair_to_mask(p: int, q: int):
 
     Output: List with coefficient in first entry and PauliMask in second
     """
-    #Check indices to keep track of coefficients
-    if q>p:    
-        if floor(q/2) == floor(p/2):
-            return [1j, PauliMask(0,2**floor(q/2))]
-        else:
-            x_mask = 2**floor(p/2)+2**floor(q/2)
-            z_mask = sum(2**i for i in range(floor(p/2)+1, floor(q/2)))
-            if q%2==1:
-                z_mask += 2**floor(q/2)
-            if p%2==0:
-                z_mask += 2**floor(p/2)
-                return [-1j, PauliMask(x_mask, z_mask)]
-            else:
-                return [1j, PauliMask(x_mask, z_mask)]
-    else: 
-        if floor(q/2) == floor(p/2):
-            return [-1j, PauliMask(0,2**floor(q/2))]
-        else:
-            x_mask = 2**floor(q/2)+2**floor(p/2)
-            z_mask = sum(2**i for i in range(floor(q/2)+1, floor(p/2)))
-            if p%2==1:
-                z_mask += 2**floor(p/2)
-            if q%2==0:
-                z_mask += 2**floor(q/2)
-                return [1j, PauliMask(x_mask, z_mask)]
-            else:
-                return [-1j, PauliMask(x_mask, z_mask)]
+    sign, i_power, x_mask, z_mask = _pair_masks(p, q)
+    return [sign*1j**i_power, PauliMask(x_mask, z_mask)]
 
-def SYK_hamil(n: int, J: float=1, coefs: list | None = None, random_seed: int | None = None):
+def _pair_table(n: int, dtype=np.int64):
     """
-    Function generating hamiltonian for the SYK model with 4-body interactions as a PauliSum
-    We are only using coefficients with increasing indices and so the coupling constant is multiplied by 4! accordingly.
+    Table of the JW transform of all majorana pairs (p,q) with p<q
+
+    :param n: Integer specifying number of qubits (i.e., 2n Majorana fermions)
+    :type n: int
+
+    Output: (2n, 2n) arrays of signs, powers of 1j, x masks and z masks indexed by [p, q]
+    """
+    pair_sign = np.zeros((2*n, 2*n), dtype=np.int64)
+    pair_power = np.zeros((2*n, 2*n), dtype=np.int64)
+    pair_x = np.zeros((2*n, 2*n), dtype=dtype)
+    pair_z = np.zeros((2*n, 2*n), dtype=dtype)
+    for p in range(2*n):
+        for q in range(p+1, 2*n):
+            pair_sign[p, q], pair_power[p, q], pair_x[p, q], pair_z[p, q] = _pair_masks(p, q)
+    return pair_sign, pair_power, pair_x, pair_z
+
+def _syk_terms(idx: np.ndarray, pair_table: tuple):
+    """
+    Kernel computing the JW transform of products of four majorana fermions with increasing indices
+
+    :param idx: Array of shape (C, 4) with the majorana indices p<q<r<s of every term
+    :type idx: np.ndarray
+
+    :param pair_table: Output of _pair_table for the number of qubits
+    :type pair_table: tuple
+
+    Output: Arrays of x masks, z masks and real signs (+-1) of the terms
+    """
+    pair_sign, pair_power, pair_x, pair_z = pair_table
+    p, q, r, s = idx.T
+
+    x1, z1 = pair_x[p, q], pair_z[p, q]
+    x2, z2 = pair_x[r, s], pair_z[r, s]
+
+    #Pauli product is the XOR of the masks
+    x_masks = x1 ^ x2
+    z_masks = z1 ^ z2
+
+    #Total power of 1j is even as the term is hermitian, i.e. 1j**power is +-1
+    power = pair_power[p, q] + pair_power[r, s] + pauli_mul_phase(x1, z1, x2, z2)
+    signs = pair_sign[p, q]*pair_sign[r, s]*(1 - (power & 2))
+
+    return x_masks, z_masks, signs
+
+def _syk_chunks(n: int, chunk_size: int):
+    """
+    Generator applying _syk_terms to consecutive chunks of the ordered majorana quadruples
+
+    :param n: Integer specifying number of qubits (i.e., 2n Majorana fermions)
+    :type n: int
+
+    :param chunk_size: Maximal number of terms per chunk
+    :type chunk_size: int
+
+    Output: Arrays of x masks, z masks and signs per chunk, ordered as itertools.combinations
+    """
+    #Masks stop fitting into int64 beyond 63 qubits, fall back to python integers
+    pair_table = _pair_table(n, dtype=np.int64 if n < 63 else object)
+
+    quadruples = combinations(range(2*n), 4)
+    while True:
+        idx = np.array(list(islice(quadruples, chunk_size)), dtype=np.int64).reshape(-1, 4)
+        if len(idx) == 0:
+            return
+        yield _syk_terms(idx, pair_table)
+
+def SYK_hamil_stream(n: int, J: float=1, coefs: list | None = None, random_seed: int | None = None,
+                     chunk_size: int = 10000):
+    """
+    Generator yielding the terms of the SYK hamiltonian as (coefficient, x_mask, z_mask) tuples
+    Terms and order are the same as for SYK_hamil, but they are computed chunk by chunk and no PauliSum is built.
 
     :param n: Integer specifying number of qubits (i.e., 2n Majorana fermions)
     :type n: int
@@ -59,26 +179,43 @@ def SYK_hamil(n: int, J: float=1, coefs: list | None = None, random_seed: int |
 
     :param random_seed(optional, default = none): Ability to set random_seed for testing/reproducability purposes
     :type n: int
-    """
 
-    if random_seed is not None:
-        np.random.seed(random_seed)
-    
+    :param chunk_size: Number of terms computed at once
+    :type chunk_size: int
+    """
     scale = np.sqrt(6/(2*n)**3)*J
-    hamil = PauliSum()
-
-    for (ind, tup) in enumerate(combinations(range(2*n),4)):
-        #Generate JW transform for the first and last two indices
-        pauli_op1 = SYK_pair_to_mask(tup[0],tup[1])
-        pauli_op2 = SYK_pair_to_mask(tup[2],tup[3])
+    rng = np.random.default_rng(random_seed)
 
-        #Draw coefficients from a normal distribution
-        if coefs:
-            coef = coefs[ind]
+    offset = 0
+    for x_masks, z_masks, signs in _syk_chunks(n, chunk_size):
+        #Draw the coefficients of the chunk from a normal distribution at once
+        if coefs is None:
+            chunk_coefs = rng.normal(loc=0, scale= scale, size = len(signs))
         else:
-            coef = np.random.normal(loc=0, scale= scale, size = 1)[0]
+            chunk_coefs = np.asarray(coefs[offset:offset+len(signs)])
+        offset += len(signs)
+
+        weights = signs*chunk_coefs/96
+        yield from zip(weights.tolist(), x_masks.tolist(), z_masks.tolist())
+
+def SYK_hamil(n: int, J: float=1, coefs: list | None = None, random_seed: int | None = None):
+    """
+    Function generating hamiltonian for the SYK model with 4-body interactions as a PauliSum
+    We are only using coefficients with increasing indices and so the coupling constant is multiplied by 4! accordingly.
+
+    :param n: Integer specifying number of qubits (i.e., 2n Majorana fermions)
+    :type n: int
+
+    :param J: coupling constant (for the model with ordered coefficients)
+    :type J: float
+
+    :param coefs: array of coefficients drawn from an appropriate distribution
+    :type coefs: list
 
-        #As indices are increasing, the parity does not change
-        hamil.append([1/(96)*coef*np.real(pauli_op1[0]*pauli_op2[0]), pauli_op1[1]*pauli_op2[1]])
+    :param random_seed(optional, default = none): Ability to set random_seed for testing/reproducability purposes
+    :type n: int
+    """
+    #Build the PauliSum in one call rather than appending term by term
+    terms = [[coef, PauliMask(x_mask, z_mask)] for coef, x_mask, z_mask in SYK_hamil_stream(n, J, coefs, random_seed)]
 
-    return hamil
+    return PauliSum(*terms)
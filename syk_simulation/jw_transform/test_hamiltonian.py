@@ -1,7 +1,7 @@
 from workbench_algorithms.utils import PauliMask, PauliSum 
 from math import floor 
 from itertools import combinations
-from .hamiltonian import SYK_pair_to_mask, SYK_hamil
+from .hamiltonian import SYK_pair_to_mask, SYK_hamil, SYK_hamil_stream, pauli_mul_phase
 from scipy.special import comb
 
 import numpy as np
@@ -88,12 +88,54 @@ def test_majorana_prod_string():
         assert mult_SYK_pairs(array_perm)[1] == mult_SYK_pairs(array)[1]
 
 
+def pauli_matrix(x_mask: int, z_mask: int, n: int):
+    #Dense matrix of the Pauli string with masks x_mask, z_mask on n qubits
+    paulis = {(0,0): np.eye(2), (1,0): np.array([[0,1],[1,0]]),
+              (0,1): np.diag([1,-1]), (1,1): np.array([[0,-1j],[1j,0]])}
+    matrix = np.eye(1)
+    for i in range(n):
+        matrix = np.kron(paulis[((x_mask >> i) & 1, (z_mask >> i) & 1)], matrix)
+    return matrix
+
+def test_pauli_mul_phase():
+    #Brute force over all pairs of 3 qubit Pauli strings
+    n = 3
+    masks = [(x, z) for x in range(2**n) for z in range(2**n)]
+    x1, z1, x2, z2 = np.array([[*m1, *m2] for m1 in masks for m2 in masks]).T
+
+    expected = []
+    for a, b, c, d in zip(x1, z1, x2, z2):
+        product = pauli_matrix(a, b, n) @ pauli_matrix(c, d, n)
+        result = pauli_matrix(a ^ c, b ^ d, n)
+        k = [i for i in range(4) if np.allclose(product, 1j**i*result)]
+        assert len(k) == 1
+        expected.append(k[0])
+        assert pauli_mul_phase(int(a), int(b), int(c), int(d)) == k[0]
+
+    #Arrays of masks through the byte lookup table, and through the python integer fallback beyond 64 qubits
+    for dtype, shift in ((np.int64, 0), (object, 70)):
+        x1_, z1_, x2_, z2_ = (mask.astype(dtype) << shift for mask in (x1, z1, x2, z2))
+        assert np.array_equal(pauli_mul_phase(x1_, z1_, x2_, z2_), expected)
+
 def test_syk_summands():
     for i in range(2,12):
         theory = comb(2*i, 4)
         hamil = SYK_hamil(i)
         assert theory == len(hamil)
 
+def test_syk_stream():
+    #Compare every term across chunk boundaries with the product of its two majorana pairs
+    n = 5
+    coefs = np.random.default_rng(7).normal(size=comb(2*n, 4, exact=True))
+    terms = list(SYK_hamil_stream(n, coefs=coefs, chunk_size=37))
+    indices = list(combinations(range(2*n), 4))
+    assert len(terms) == len(indices)
+
+    for (coef, x_mask, z_mask), index, syk_coef in zip(terms, indices, coefs):
+        sign, pauli_op = mult_SYK_pairs(index)
+        assert isclose(coef, sign*syk_coef/96)
+        assert PauliMask(x_mask, z_mask).get_pauli_string() == pauli_op.get_pauli_string()
+
 def compare_syk_distribution(n: int, J: float, rtol=1e-3, atol=1e-4):
     hamil = SYK_hamil(n, J= J)
     coefs = hamil.get_coefficients()
@@ -1 +1 @@
-from .ppr import PPR
+from .ppr import PPR, ppr_frame
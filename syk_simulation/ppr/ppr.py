@@ -2,8 +2,92 @@ import numpy as np
 from psiqworkbench import Qubits, Qubrick, Units
 
 
+def _to_deg(theta) -> float:
+    """Convert a rotation angle (float | RotationAngle | tuple[int, int]) to degrees."""
+    if hasattr(theta, "to"):
+        return theta.to("deg").mag
+    if isinstance(theta, tuple):
+        # Convert fraction of pi to degrees
+        return np.rad2deg(np.pi * theta[0] / theta[1])
+    # Raw floats: assume degrees if they are > 2pi, else radians
+    if abs(theta) > 2 * np.pi:
+        return theta
+    return np.rad2deg(theta)
+
+
+def ppr_frame(x_mask: int, z_mask: int) -> tuple[int, int, tuple[int, ...]]:
+    """Precompute the parts of a PPR that only depend on the Pauli masks.
+
+    Trotter and qDRIFT apply the same Pauli products many times, so they compute the frame of every
+    term once and pass it to PPR.compute.
+
+    Args:
+        x_mask (int): Bitmask indicating which qubits have X in the Pauli product.
+        z_mask (int): Bitmask indicating which qubits have Z in the Pauli product.
+
+    Returns:
+        Tuple of the Y mask, the target qubit index and the control qubit indices of the CNOT chain.
+    """
+    qubits_in_masks = x_mask | z_mask
+    y_mask = x_mask & z_mask
+
+    target = qubits_in_masks.bit_length() - 1
+    controls_mask = qubits_in_masks & ~(1 << target)
+
+    controls = tuple(i for i in range(target) if controls_mask >> i & 1)
+
+    return y_mask, target, controls
+
+
+def _z_rotation_weight1(qubits: Qubits, target: int, controls: tuple[int, ...], angle_deg: float, ctrl: Qubits | None):
+    """Rz rotation of a single active qubit, no CNOT chain needed."""
+    qubits[target].rz(2.0 * angle_deg)
+
+
+def _z_rotation_weight2(qubits: Qubits, target: int, controls: tuple[int, ...], angle_deg: float, ctrl: Qubits | None):
+    """Rz rotation of the Z parity of two active qubits with a single CNOT pair."""
+    target_qubit = qubits[target]
+    control_qubit = ctrl | qubits[controls[0]]
+
+    target_qubit.x(cond=control_qubit)
+    target_qubit.rz(2.0 * angle_deg)
+    target_qubit.x(cond=control_qubit)
+
+
+def _z_rotation_weightk(qubits: Qubits, target: int, controls: tuple[int, ...], angle_deg: float, ctrl: Qubits | None):
+    """Rz rotation of the Z parity of any number of active qubits with a CNOT chain onto the target."""
+    control_qubits = [ctrl | qubits[control_idx] for control_idx in controls]
+
+    target_qubit = qubits[target]
+    target_x = target_qubit.x
+
+    # CNOT chain for Z parity
+    for control_qubit in control_qubits:
+        target_x(cond=control_qubit)
+
+    # Apply Rz rotation on the last qubit
+    target_qubit.rz(2.0 * angle_deg)
+
+    # Uncompute CNOT chain from Z parity
+    for control_qubit in reversed(control_qubits):
+        target_x(cond=control_qubit)
+
+
+# Z parity rotations keyed by the number of active qubits, other weights use the generic CNOT chain
+_specializations = {1: _z_rotation_weight1, 2: _z_rotation_weight2}
+
+
 class PPR(Qubrick):
-    def _compute(self, qubits: Qubits, theta, x_mask: int, z_mask: int, ctrl: Qubits | None = None):
+    def _compute(
+        self,
+        qubits: Qubits,
+        theta,
+        x_mask: int,
+        z_mask: int,
+        ctrl: Qubits | None = None,
+        theta_is_deg: bool = False,
+        frame: tuple[int, int, tuple[int, ...]] | None = None,
+    ):
         """Apply a Pauli Product Rotation on the specified qubits.
 
         Args:
@@ -11,6 +95,11 @@ class PPR(Qubrick):
             theta (float | RotationAngle | tuple[int, int]): The rotation angle.
             x_mask (int): Bitmask indicating which qubits have X in the Pauli product.
             z_mask (int): Bitmask indicating which qubits have Z in the Pauli product.
+            theta_is_deg (bool): Set if theta is already a float in degrees, skips the angle conversion.
+            frame (tuple): Optional ppr_frame(x_mask, z_mask), skips recomputing it from the masks.
+
+        Raises:
+            ValueError: If frame does not belong to x_mask and z_mask.
         """
         # Get active qubits from masks to determine target qubit
         qubits_in_masks = x_mask | z_mask
@@ -25,21 +114,15 @@ class PPR(Qubrick):
             return
 
         # Standardize Angle
-        if hasattr(theta, "to"):
-            angle_deg = theta.to("deg").mag
-        elif isinstance(theta, tuple):
-            # Convert fraction of pi to degrees
-            angle_deg = np.rad2deg(np.pi * theta[0] / theta[1])
-        else:
-            # Raw floats: assume degrees if they are > 2pi, else radians
-            if abs(theta) > 2 * np.pi:
-                angle_deg = theta
-            else:
-                angle_deg = np.rad2deg(theta)
+        angle_deg = theta if theta_is_deg else _to_deg(theta)
 
         # get QPU from qubits to use QPU gates
         ppr_qpu = qubits.qpu
-        y_mask = x_mask & z_mask
+        if frame is None:
+            frame = ppr_frame(x_mask, z_mask)
+        elif frame[0] != x_mask & z_mask or frame[1] != qubits_in_masks.bit_length() - 1:
+            raise ValueError(f"PPR frame {frame} does not match x_mask={x_mask:#b}, z_mask={z_mask:#b}")
+        y_mask, target, controls = frame
 
         # Adjust any qubits with Clifford gates to get them into Z basis
         if y_mask:
@@ -47,26 +130,9 @@ class PPR(Qubrick):
         if x_mask:
             ppr_qpu.had(x_mask, condition_mask=ctrl_mask)
 
-        target = qubits_in_masks.bit_length() - 1
-        controls_mask = qubits_in_masks & ~(1 << target)
-
-        uncomputation_controls = []
-        temp_mask = controls_mask
-
-        # CNOT chain for Z parity (make sure more than 1 active qubit in masks)
-        while temp_mask:
-            lsb = temp_mask & -temp_mask
-            control_idx = lsb.bit_length() - 1
-            qubits[target].x(cond=(ctrl | qubits[control_idx]))
-            uncomputation_controls.append(control_idx)
-            temp_mask ^= lsb
-
-        # Apply Rz rotation on the last qubit
-        qubits[target].rz(2.0 * angle_deg)
-
-        # Uncompute CNOT chain from Z parity
-        for control_idx in reversed(uncomputation_controls):
-            qubits[target].x(cond=(ctrl | qubits[control_idx]))
+        # Rotate the Z parity of the active qubits, specialized for low weight Pauli products
+        z_rotation = _specializations.get(qubits_in_masks.bit_count(), _z_rotation_weightk)
+        z_rotation(qubits, target, controls, angle_deg, ctrl)
 
         # Uncompute basis changes
         if x_mask:
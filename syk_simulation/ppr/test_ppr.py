@@ -2,9 +2,9 @@ from psiqworkbench import QPU, Qubits, Units
 from random import randint, uniform
 import numpy as np
 
-from pytest import mark
+from pytest import mark, raises
 
-from syk_simulation.ppr import PPR
+from syk_simulation.ppr import PPR, ppr_frame
 
 
 @mark.parametrize(
@@ -74,6 +74,20 @@ def test_ppr_statevec_manual():
     run_test_ppr_statevec(num_qubits, x_mask, z_mask, theta, state)
 
 
+def test_ppr_frame_mismatch():
+    num_qubits = 3
+    qpu = QPU(num_qubits=num_qubits)
+    qubits = Qubits(qpu=qpu, num_qubits=num_qubits)
+
+    ppr = PPR()
+    # Frame of X0 X1 applied to the masks of X0 X2
+    with raises(ValueError):
+        ppr.compute(qubits, theta=90.0, x_mask=0b101, z_mask=0b000, frame=ppr_frame(0b011, 0b000))
+    # Frame of Y0 X1 applied to the masks of X0 X1
+    with raises(ValueError):
+        ppr.compute(qubits, theta=90.0, x_mask=0b011, z_mask=0b000, frame=ppr_frame(0b011, 0b001))
+
+
 def run_test_ppr(
     num_qubits: int,
     x_mask: int,
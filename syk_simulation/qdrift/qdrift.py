@@ -10,7 +10,9 @@ Hamiltonians with many terms
 import numpy as np
 from psiqworkbench import Qubits
 from workbench_algorithms.utils.paulimask import PauliSum
+from syk_simulation.ppr import ppr_frame
 from syk_simulation.qdrift.utils import sample_distribution
+from syk_simulation.trotter import second_order_rotation_count
 
 
 def qdrift(
@@ -49,6 +51,9 @@ def qdrift(
 
     dt = time / num_samples
 
+    # PPR frames of the sampled terms, computed once per term
+    frames = {}
+
     # Perform N random samples
     for _ in range(num_samples):
         # Sample term j with probability |cⱼ|/λ
@@ -64,11 +69,15 @@ def qdrift(
         if qubits_in_masks == 0:
             continue
 
-        # Apply e^(-i·sign(cⱼ)·λ·Pⱼ·dt)
+        # Apply e^(-i·sign(cⱼ)·λ·Pⱼ·dt), the angle is in radians however large it is
         coeff = coefficients[j]
-        theta = np.sign(coeff) * lambda_norm * dt
+        theta = np.rad2deg(np.sign(coeff) * lambda_norm * dt)
+
+        frame = frames.get(j)
+        if frame is None:
+            frame = frames[j] = ppr_frame(x_mask, z_mask)
 
-        ppr_instance.compute(qubits, theta=theta, x_mask=x_mask, z_mask=z_mask)
+        ppr_instance.compute(qubits, theta=theta, x_mask=x_mask, z_mask=z_mask, theta_is_deg=True, frame=frame)
 
 
 def qdrift_with_epsilon(
@@ -131,7 +140,6 @@ def qdrift_vs_trotter_cost(hamiltonian: PauliSum, time: float, epsilon: float) -
     # Extract coefficients
     coefficients = [hamiltonian.get_coefficient(i) for i in range(len(hamiltonian))]
     lambda_norm = sum(abs(c) for c in coefficients)
-    num_terms = len(hamiltonian)
 
     # qDRIFT cost
     qdrift_samples = int(np.ceil(2 * (lambda_norm * time) ** 2 / (epsilon**2)))
@@ -140,7 +148,7 @@ def qdrift_vs_trotter_cost(hamiltonian: PauliSum, time: float, epsilon: float) -
     # Second-order Trotter cost (error ≈ (λt)³/(12N²))
     # Solving for N: N ≈ (λt)^(3/2) / sqrt(12ε)
     trotter_steps = int(np.ceil((lambda_norm * time) ** 1.5 / np.sqrt(12 * epsilon)))
-    trotter_gates = 2 * num_terms * trotter_steps
+    trotter_gates = second_order_rotation_count(hamiltonian, trotter_steps)
 
     return {
         "qdrift_samples": qdrift_samples,
@@ -282,6 +282,24 @@ def test_qdrift_empty_hamiltonian():
     qdrift(hamiltonian, qubits, ppr, time, num_samples)
 
 
+def test_qdrift_large_angle():
+    """Verify that rotation angles beyond 2π are still treated as radians."""
+    num_qubits = 1
+
+    # A single term is sampled every time, so qDRIFT is exact
+    hamiltonian = PauliSum([3.0, PauliMask(0b0, 0b1)])  # 3*Z0
+
+    time = 10.0
+
+    qpu = QPU(num_qubits=num_qubits, filters=">>unitary>>")
+    qdrift(hamiltonian, Qubits(qpu=qpu, num_qubits=num_qubits), PPR(), time, num_samples=1, random_seed=42)
+    qdrift_matrix = qpu.get_filter_by_name(">>unitary>>").get()
+
+    exact_matrix = exact_time_evolution(hamiltonian, num_qubits, time)
+
+    assert np.isclose(compute_fidelity(qdrift_matrix, exact_matrix), 1.0, atol=1e-10)
+
+
 def create_heisenberg_xxx(num_qubits: int, J: float = 1.0) -> PauliSum:
     """Helper to create Heisenberg XXX Hamiltonian terms."""
     terms = []
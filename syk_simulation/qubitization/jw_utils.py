@@ -1,6 +1,7 @@
 import numpy as np
 from workbench_algorithms.utils.paulimask import PauliSum, PauliMask, pauli_sum_to_numpy
 from psiqworkbench.utils.numpy_utils import reverse_numpy_op
+from syk_simulation.jw_transform.hamiltonian import pauli_mul_phase
 from syk_simulation.qubitization.utils import get_oraclea_coefficients, get_syk_coefficients, generate_walk_state_for_u
 
 
@@ -155,8 +156,8 @@ def get_classical_matrix(N=4, random_seed=2):
 ##############################################################################################################
 # another attempt using PauliSums and attempting to determine the sign
 def multiply_two_maj_ops(x1, z1, x2, z2):
-    zx_count = bin(z1 & x2).count("1")
-    xz_count = bin(x1 & z2).count("1")
+    zx_count = (z1 & x2).bit_count()
+    xz_count = (x1 & z2).bit_count()
     phase = (1j**xz_count) * ((-1j) ** zx_count)
     return x1 ^ x2, z1 ^ z2, phase
 
@@ -188,7 +189,7 @@ def classical_numpy_unitary(N, random_seed, inti_state: np.ndarray = None):
         x_mask, z_mask, sign = multiply_two_maj_ops(x_mask, z_mask, s_x_mask, s_z_mask)
         total_sign *= sign
 
-        y_count = bin(x_mask & z_mask).count("1")
+        y_count = (x_mask & z_mask).bit_count()
         pauli_mask_correction = (1j) ** y_count
         total_sign *= pauli_mask_correction
 
@@ -227,7 +228,7 @@ def pauli_sum_without_sign(N, random_seed):
         x_mask, z_mask, sign = multiply_two_maj_ops(x_mask, z_mask, s_x_mask, s_z_mask)
         total_sign *= sign
 
-        y_count = bin(x_mask & z_mask).count("1")
+        y_count = (x_mask & z_mask).bit_count()
         pauli_mask_correction = (1j) ** y_count
         total_sign *= pauli_mask_correction
 
@@ -247,25 +248,8 @@ def pauli_sum_without_sign(N, random_seed):
 
 
 def pauli_multiply(x1, z1, x2, z2):
-    phase = 1.0 + 0j
-
-    n_bits = max(x1, z1, x2, z2, 1).bit_length()
-    for bit in range(n_bits):
-        a = ((x1 >> bit) & 1, (z1 >> bit) & 1)
-        b = ((x2 >> bit) & 1, (z2 >> bit) & 1)
-        # (x,z): 00=I, 10=X, 01=Z, 11=Y
-        if a == (1, 0) and b == (0, 1):
-            phase *= -1j  # X*Z = -iY
-        elif a == (0, 1) and b == (1, 0):
-            phase *= 1j  # Z*X = iY
-        elif a == (1, 0) and b == (1, 1):
-            phase *= 1j  # X*Y = iZ
-        elif a == (1, 1) and b == (1, 0):
-            phase *= -1j  # Y*X = -iZ
-        elif a == (0, 1) and b == (1, 1):
-            phase *= -1j  # Z*Y = -iX
-        elif a == (1, 1) and b == (0, 1):
-            phase *= 1j  # Y*Z = iX
+    # (x,z): 00=I, 10=X, 01=Z, 11=Y
+    phase = 1j ** pauli_mul_phase(x1, z1, x2, z2)
 
     return phase, x1 ^ x2, z1 ^ z2
 
@@ -1 +1 @@
-from .trotter import first_order_trotter, second_order_trotter, trotter_evolution
+from .trotter import first_order_trotter, second_order_trotter, second_order_rotation_count, trotter_evolution
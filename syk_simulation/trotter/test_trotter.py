@@ -9,9 +9,18 @@ from workbench_algorithms.utils.paulimask import PauliSum, PauliMask
 from workbench_algorithms import TrotterQuery
 from scipy.linalg import expm
 
-from syk_simulation.ppr import PPR
+from syk_simulation.ppr import PPR, ppr_frame
+from syk_simulation.ppr import ppr as ppr_module
 
-from syk_simulation.trotter import first_order_trotter, second_order_trotter, trotter_evolution
+from syk_simulation.jw_transform import SYK_hamil
+from syk_simulation.trotter import (
+    first_order_trotter,
+    second_order_trotter,
+    second_order_rotation_count,
+    trotter_evolution,
+)
+from syk_simulation.trotter import trotter as trotter_module
+from syk_simulation.trotter.trotter import apply_hamiltonian_as_pprs, nonidentity_terms
 
 
 def create_hamiltonian_from_terms(terms: list[tuple[float, int, int]]) -> PauliSum:
@@ -407,6 +416,203 @@ def test_commuting_hamiltonian_exactness():
     assert np.isclose(fidelity, 1.0, atol=1e-10)
 
 
+def test_large_angle_trotter():
+    """Verify that rotation angles beyond 2π are still treated as radians."""
+    num_qubits = 1
+    hamiltonian = create_hamiltonian_from_terms([(1.0, 0b1, 0b0), (3.0, 0b0, 0b1)])  # X0 + 3*Z0
+
+    time = 10.0
+
+    qpu = QPU(num_qubits=num_qubits, filters=">>unitary>>")
+    first_order_trotter(hamiltonian, Qubits(qpu=qpu, num_qubits=num_qubits), PPR(), time, 1)
+    trotter_u = qpu.get_filter_by_name(">>unitary>>").get()
+
+    # A single first-order step is exactly e^(-i·3t·Z0) e^(-i·t·X0)
+    expected_u = expm(-1j * 3.0 * time * pauli_string_to_matrix(0, 1, 1)) @ expm(
+        -1j * time * pauli_string_to_matrix(1, 0, 1)
+    )
+
+    assert np.isclose(compute_fidelity(trotter_u, expected_u), 1.0, atol=1e-10)
+
+
+def test_nonidentity_terms():
+    """Verify that identity terms are dropped and duplicate Pauli products are merged at their first appearance."""
+    num_qubits = 2
+    hamiltonian = create_hamiltonian_from_terms(
+        [
+            (0.5, 0b01, 0b00),  # X0
+            (2.0, 0b00, 0b00),  # I
+            (0.3, 0b00, 0b11),  # Z0Z1
+            (0.2, 0b01, 0b01),  # Y0
+            (0.4, 0b10, 0b00),  # X1
+            (0.25, 0b01, 0b00),  # X0
+            (-0.2, 0b01, 0b01),  # Y0
+        ]
+    )
+
+    terms = nonidentity_terms(hamiltonian)
+    assert terms == [(0.75, 0b01, 0b00), (0.3, 0b00, 0b11), (0.4, 0b10, 0b00)]
+
+    # A single first-order step applies the merged terms in that order, the identity only adds a global phase
+    time = 0.7
+    qpu = QPU(num_qubits=num_qubits, filters=">>unitary>>")
+    first_order_trotter(hamiltonian, Qubits(qpu=qpu, num_qubits=num_qubits), PPR(), time, 1)
+    trotter_u = qpu.get_filter_by_name(">>unitary>>").get()
+
+    expected_u = np.eye(2**num_qubits)
+    for coeff, x_mask, z_mask in terms:
+        expected_u = expm(-1j * coeff * time * pauli_string_to_matrix(x_mask, z_mask, num_qubits)) @ expected_u
+
+    assert np.isclose(compute_fidelity(trotter_u, expected_u), 1.0, atol=1e-10)
+
+
+class RecordingPPR:
+    """Stand-in PPR recording the (theta, x_mask, z_mask) of every rotation instead of applying it."""
+
+    def __init__(self):
+        self.rotations = []
+
+    def compute(self, qubits, theta, x_mask, z_mask, **kwargs):
+        self.rotations.append((theta, x_mask, z_mask))
+
+
+def test_trotter_commuting_groups():
+    """Verify that the leading and trailing commuting groups are fused without reordering the other terms."""
+    # Transverse-Field Ising Model on 3 qubits: ZZ terms commute, X terms commute
+    terms = [
+        (-1.0, 0b000, 0b011),  # Z0Z1
+        (-1.0, 0b000, 0b110),  # Z1Z2
+        (-0.5, 0b001, 0b000),  # X0
+        (-0.5, 0b010, 0b000),  # X1
+        (-0.5, 0b100, 0b000),  # X2
+        (0.3, 0b000, 0b101),  # Z0Z2
+    ]
+    hamiltonian = create_hamiltonian_from_terms(terms)
+    masks = [(x_mask, z_mask) for _, x_mask, z_mask in terms]
+
+    # First order repeats all terms every step
+    ppr = RecordingPPR()
+    first_order_trotter(hamiltonian, None, ppr, 1.0, 3)
+    assert [rotation[1:] for rotation in ppr.rotations] == masks * 3
+
+    # Second order fuses Z0Z1, Z1Z2 across steps and Z0Z2 across sweeps
+    ppr = RecordingPPR()
+    second_order_trotter(hamiltonian, None, ppr, 1.0, 2)
+    first, middle, last = masks[:2], masks[2:5], masks[5:]
+    step = middle + last + middle[::-1] + first
+    assert [rotation[1:] for rotation in ppr.rotations] == first + step + step
+
+    # All terms commute, so all steps fuse into a single rotation per term
+    ppr = RecordingPPR()
+    first_order_trotter(create_hamiltonian_from_terms(terms[:2]), None, ppr, 1.0, 5)
+    assert [rotation[1:] for rotation in ppr.rotations] == masks[:2]
+
+
+def test_second_order_fusion():
+    """Verify that fusing the first and last commuting groups matches the plain symmetric splitting."""
+    num_qubits = 3
+    terms = [
+        (0.5, 0b000, 0b011),  # Z0Z1
+        (0.8, 0b000, 0b110),  # Z1Z2
+        (0.3, 0b001, 0b000),  # X0
+        (0.4, 0b010, 0b010),  # Y1
+        (0.2, 0b010, 0b000),  # X1
+        (0.6, 0b100, 0b000),  # X2
+    ]
+    hamiltonian = create_hamiltonian_from_terms(terms)
+
+    time = 0.9
+    num_steps = 3
+
+    # First group is Z0Z1, Z1Z2 and last group is X1, X2, so both fusions run
+    ppr = RecordingPPR()
+    second_order_trotter(hamiltonian, None, ppr, time, num_steps)
+    assert len(ppr.rotations) == (2 * len(terms) - 2 - 2) * num_steps + 2
+
+    qpu = QPU(num_qubits=num_qubits, filters=">>unitary>>")
+    second_order_trotter(hamiltonian, Qubits(qpu=qpu, num_qubits=num_qubits), PPR(), time, num_steps)
+    trotter_u = qpu.get_filter_by_name(">>unitary>>").get()
+
+    # Forward then backward sweep of every term, N times
+    dt = time / (2 * num_steps)
+    step_terms = terms + terms[::-1]
+    expected_u = np.eye(2**num_qubits)
+    for coeff, x_mask, z_mask in step_terms * num_steps:
+        expected_u = expm(-1j * coeff * dt * pauli_string_to_matrix(x_mask, z_mask, num_qubits)) @ expected_u
+
+    assert np.isclose(compute_fidelity(trotter_u, expected_u), 1.0, atol=1e-10)
+
+
+@pytest.mark.parametrize("n", [3, 4, 5])
+def test_syk_rotation_count(n):
+    """Verify the rotation counts used for gate and resource estimates against the emitted circuit."""
+    resource_estimation = pytest.importorskip("syk_simulation.trotter.resource_estimation")
+
+    hamiltonian = SYK_hamil(n, random_seed=42)
+    num_steps = 15
+
+    ppr = RecordingPPR()
+    second_order_trotter(hamiltonian, None, ppr, 0.5, num_steps)
+
+    assert len(ppr.rotations) == second_order_rotation_count(hamiltonian, num_steps)
+    assert len(ppr.rotations) == resource_estimation.get_syk_trotter_rotations(2 * n, num_steps)
+
+
+def test_ppr_frames_reused(monkeypatch):
+    """Verify that the PPR frame of every term is computed once per evolution, not once per step."""
+    calls = []
+
+    def counting_ppr_frame(x_mask, z_mask):
+        calls.append((x_mask, z_mask))
+        return ppr_frame(x_mask, z_mask)
+
+    monkeypatch.setattr(trotter_module, "ppr_frame", counting_ppr_frame)
+    monkeypatch.setattr(ppr_module, "ppr_frame", counting_ppr_frame)
+
+    num_qubits = 2
+    terms = [(0.8, 0b11, 0b00), (0.6, 0b00, 0b11), (0.4, 0b01, 0b00)]  # X0*X1, Z0*Z1, X0
+    hamiltonian = create_hamiltonian_from_terms(terms)
+
+    for evolve in (first_order_trotter, second_order_trotter):
+        calls.clear()
+        qpu = QPU(num_qubits=num_qubits, filters=">>unitary>>")
+        evolve(hamiltonian, Qubits(qpu=qpu, num_qubits=num_qubits), PPR(), 1.0, 20)
+
+        assert sorted(calls) == sorted((x_mask, z_mask) for _, x_mask, z_mask in terms)
+
+        fidelity = compute_fidelity(
+            qpu.get_filter_by_name(">>unitary>>").get(), exact_time_evolution(hamiltonian, num_qubits, 1.0)
+        )
+        assert fidelity > 0.99
+
+
+def test_apply_hamiltonian_streams_terms():
+    """Verify that a single sweep applies each term of a generator before reading the next one."""
+    log = []
+
+    def terms():
+        for coeff, x_mask, z_mask in [(0.5, 0b01, 0b00), (1.0, 0b00, 0b00), (0.3, 0b00, 0b11), (0.2, 0b01, 0b00)]:
+            log.append(("read", x_mask, z_mask))
+            yield coeff, x_mask, z_mask
+
+    class LoggingPPR:
+        def compute(self, qubits, theta, x_mask, z_mask, **kwargs):
+            log.append(("apply", x_mask, z_mask))
+
+    apply_hamiltonian_as_pprs(terms(), None, LoggingPPR(), 0.1)
+
+    # The identity term is read but not applied, the duplicate X0 is applied separately
+    assert log == [
+        ("read", 0b01, 0b00),
+        ("apply", 0b01, 0b00),
+        ("read", 0b00, 0b00),
+        ("read", 0b00, 0b11),
+        ("apply", 0b00, 0b11),
+        ("read", 0b01, 0b00),
+        ("apply", 0b01, 0b00),
+    ]
+
+
 def test_energy_conservation():
     """Verify that the expectation value of H is conserved during Trotter evolution."""
     num_qubits = 2
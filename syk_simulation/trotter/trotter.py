@@ -5,79 +5,219 @@ This module implements first-order and second-order Trotter-Suzuki decomposition
 for approximating time evolution under a Hamiltonian H
 """
 
+from collections.abc import Iterable
+from itertools import islice
+
+import numpy as np
 from psiqworkbench import Qubits
 from workbench_algorithms.utils.paulimask import PauliSum
 
+from syk_simulation.ppr import ppr_frame
+
+
+def _hamiltonian_terms(hamiltonian: PauliSum | Iterable[tuple[float, int, int]]) -> Iterable[tuple[float, int, int]]:
+    """
+    Iterate over the terms of a Hamiltonian as (coeff, x_mask, z_mask) tuples, without copying them
+
+    Args:
+        hamiltonian: PauliSum Hamiltonian H = Σ cⱼ Pⱼ, or an iterable of
+            (coeff, x_mask, z_mask) terms such as SYK_hamil_stream
+    """
+    if not hasattr(hamiltonian, "get_mask"):
+        return hamiltonian
+
+    # Fetch all coefficients in one call instead of one accessor call per term
+    coefficients = np.asarray(hamiltonian.get_coefficients()).tolist()
+    masks = (hamiltonian.get_mask(i) for i in range(len(coefficients)))
+    return ((coeff, mask[0], mask[1]) for coeff, mask in zip(coefficients, masks))
+
+
+def nonidentity_terms(hamiltonian: PauliSum | Iterable[tuple[float, int, int]]) -> list[tuple[float, int, int]]:
+    """
+    Extract the terms of a Hamiltonian as (coeff, x_mask, z_mask) tuples
+
+    Identity terms are dropped as they need no gates, and terms with the same
+    Pauli product are merged by summing their coefficients. All terms are held
+    in memory, also when the Hamiltonian is given as a generator.
+
+    Args:
+        hamiltonian: PauliSum Hamiltonian H = Σ cⱼ Pⱼ, or an iterable of
+            (coeff, x_mask, z_mask) terms such as SYK_hamil_stream
+
+    Returns:
+        List of (coefficient, x_mask, z_mask) in order of first appearance in the Hamiltonian
+    """
+    merged = {}
+    for coeff, x_mask, z_mask in _hamiltonian_terms(hamiltonian):
+        if x_mask | z_mask:
+            key = (x_mask, z_mask)
+            merged[key] = merged.get(key, 0) + coeff
+
+    return [(coeff, x_mask, z_mask) for (x_mask, z_mask), coeff in merged.items() if coeff != 0]
+
+
+def _commute(x1: int, z1: int, x2: int, z2: int) -> bool:
+    """Two Pauli products commute iff they anticommute on an even number of qubits"""
+    return not ((x1 & z2) ^ (z1 & x2)).bit_count() & 1
+
+
+def _commutes_with_basis(basis: dict[tuple[int, int], tuple[int, int]], x_mask: int, z_mask: int) -> bool:
+    """
+    Check if a Pauli product commutes with all terms of a group given a basis of their masks
+
+    Commutation is linear in the masks, so checking the basis is enough. The masks of
+    mutually commuting Pauli products on n qubits span at most n dimensions, so this
+    costs O(n) per check instead of O(group size).
+    """
+    return all(_commute(x_mask, z_mask, x, z) for x, z in basis.values())
+
+
+def _add_to_basis(basis: dict[tuple[int, int], tuple[int, int]], x_mask: int, z_mask: int) -> None:
+    """Add (x_mask, z_mask) to a GF(2) basis keyed by pivot bit, unless it is already in its span"""
+    while x_mask or z_mask:
+        pivot = (1, x_mask.bit_length()) if x_mask else (0, z_mask.bit_length())
+        if pivot not in basis:
+            basis[pivot] = (x_mask, z_mask)
+            return
+        x, z = basis[pivot]
+        x_mask ^= x
+        z_mask ^= z
+
+
+def _commuting_run(terms: Iterable[tuple[float, int, int]]) -> int:
+    """
+    Number of leading (coeff, x_mask, z_mask) terms that mutually commute
+
+    Within such a group the order of the terms is irrelevant, so the Trotter formulas
+    fuse repeated applications of the first and last groups. Only these two groups are
+    needed, not a full partition of the terms into commuting groups.
+    """
+    basis = {}
+    count = 0
+    for _, x_mask, z_mask in terms:
+        if not _commutes_with_basis(basis, x_mask, z_mask):
+            break
+        _add_to_basis(basis, x_mask, z_mask)
+        count += 1
+
+    return count
+
+
+def _fused_groups(terms: list[tuple[float, int, int]]) -> tuple[int, int]:
+    """
+    Sizes of the leading and trailing commuting groups fused by second_order_trotter
+
+    The trailing group starts after the leading one, and is empty if all terms commute.
+    """
+    num_first = _commuting_run(terms)
+    num_last = _commuting_run(islice(reversed(terms), len(terms) - num_first))
+    return num_first, num_last
+
+
+def _ppr_frames(terms: list[tuple[float, int, int]]) -> dict[tuple[int, int], tuple]:
+    """
+    Compute the PPR frame of every (coeff, x_mask, z_mask) term once, keyed by (x_mask, z_mask)
+
+    Args:
+        terms: List of (coefficient, x_mask, z_mask)
+    """
+    return {(x_mask, z_mask): ppr_frame(x_mask, z_mask) for _, x_mask, z_mask in terms}
+
+
+def _rotation_terms(
+    terms: list[tuple[float, int, int]], time_step: float, frames: dict[tuple[int, int], tuple] | None = None
+) -> list[tuple[float, int, int, tuple]]:
+    """
+    Precompute the PPRs e^(-i·coeff·P·dt) of (coeff, x_mask, z_mask) terms as (angle_deg, x_mask, z_mask, frame)
+
+    Args:
+        terms: List of (coefficient, x_mask, z_mask)
+        time_step: Time step dt for evolution
+        frames: PPR frames from _ppr_frames, computed from the terms if not given
+    """
+    if frames is None:
+        frames = _ppr_frames(terms)
+    return [(np.rad2deg(coeff * time_step), x_mask, z_mask, frames[x_mask, z_mask]) for coeff, x_mask, z_mask in terms]
+
 
-def apply_hamiltonian_as_pprs(hamiltonian: PauliSum, qubits: Qubits, ppr_instance, time_step: float) -> None:
+def _apply_rotation_terms(terms: list[tuple[float, int, int, tuple]], qubits: Qubits, ppr_instance) -> None:
+    """
+    Apply precomputed (angle_deg, x_mask, z_mask, frame) terms as PPR operations in the given order
+
+    Args:
+        terms: Rotation terms from _rotation_terms
+        qubits: Qubits to apply operations on
+        ppr_instance: PPR object for applying rotations
+    """
+    for theta, x_mask, z_mask, frame in terms:
+        ppr_instance.compute(qubits, theta=theta, x_mask=x_mask, z_mask=z_mask, theta_is_deg=True, frame=frame)
+
+
+def apply_hamiltonian_as_pprs(
+    hamiltonian: PauliSum | Iterable[tuple[float, int, int]], qubits: Qubits, ppr_instance, time_step: float
+) -> None:
     """
     Apply all terms of a Hamiltonian as PPR operations
 
     Applies terms in forward order: P₁, P₂, ..., Pₘ
 
+    Terms are applied one at a time as they are read, so a generator such as
+    SYK_hamil_stream is never held in memory as a whole. Duplicate Pauli products
+    are applied separately rather than merged.
+
     Args:
-        hamiltonian: PauliSum Hamiltonian H = Σ cⱼ Pⱼ
+        hamiltonian: PauliSum Hamiltonian H = Σ cⱼ Pⱼ, or an iterable of (coeff, x_mask, z_mask) terms
         qubits: Qubits to apply operations on
         ppr_instance: PPR object for applying rotations
         time_step: Time step dt for evolution
     """
-    for i in range(len(hamiltonian)):
-        coeff = hamiltonian.get_coefficient(i)
-        mask = hamiltonian.get_mask(i)
-
-        x_mask = mask[0]
-        z_mask = mask[1]
-
-        # Skip identity terms (no gates needed)
-        qubits_in_masks = x_mask | z_mask
-        if qubits_in_masks == 0:
+    for coeff, x_mask, z_mask in _hamiltonian_terms(hamiltonian):
+        # Skip identity and zero terms (no gates needed)
+        if coeff == 0 or x_mask | z_mask == 0:
             continue
 
         # Apply e^(-i·coeff·P·dt)
-        theta = coeff * time_step
-        ppr_instance.compute(qubits, theta=theta, x_mask=x_mask, z_mask=z_mask)
+        theta = np.rad2deg(coeff * time_step)
+        ppr_instance.compute(qubits, theta=theta, x_mask=x_mask, z_mask=z_mask, theta_is_deg=True)
 
 
-def apply_hamiltonian_as_pprs_reversed(hamiltonian: PauliSum, qubits: Qubits, ppr_instance, time_step: float) -> None:
+def apply_hamiltonian_as_pprs_reversed(
+    hamiltonian: PauliSum | Iterable[tuple[float, int, int]], qubits: Qubits, ppr_instance, time_step: float
+) -> None:
     """
     Apply all terms of a Hamiltonian as PPR operations in reverse order
 
     Applies terms in order: Pₘ, ..., P₂, P₁
 
+    Like apply_hamiltonian_as_pprs duplicate Pauli products are not merged, but
+    all terms are held in memory to reverse them.
 
     Args:
-        hamiltonian: PauliSum Hamiltonian H = Σ cⱼ Pⱼ
+        hamiltonian: PauliSum Hamiltonian H = Σ cⱼ Pⱼ, or an iterable of (coeff, x_mask, z_mask) terms
         qubits: Qubits to apply operations on
         ppr_instance: PPR object for applying rotations
         time_step: Time step dt for evolution
     """
-    # Apply terms in reverse order
-    for i in range(len(hamiltonian) - 1, -1, -1):
-        coeff = hamiltonian.get_coefficient(i)
-        mask = hamiltonian.get_mask(i)
-
-        x_mask = mask[0]
-        z_mask = mask[1]
-
-        # Skip identity terms
-        qubits_in_masks = x_mask | z_mask
-        if qubits_in_masks == 0:
-            continue
-
-        # Apply e^(-i·coeff·P·dt)
-        theta = coeff * time_step
-        ppr_instance.compute(qubits, theta=theta, x_mask=x_mask, z_mask=z_mask)
+    terms = [term for term in _hamiltonian_terms(hamiltonian) if term[0] != 0 and term[1] | term[2]]
+    _apply_rotation_terms(_rotation_terms(terms, time_step)[::-1], qubits, ppr_instance)
 
 
 def first_order_trotter(
-    hamiltonian: PauliSum, qubits: Qubits, ppr_instance, time: float, num_trotter_steps: int
+    hamiltonian: PauliSum | Iterable[tuple[float, int, int]],
+    qubits: Qubits,
+    ppr_instance,
+    time: float,
+    num_trotter_steps: int,
 ) -> None:
     """
     First-order Trotter-Suzuki decomposition
     where N is the number of Trotter steps.
 
+    All steps apply the same terms, so they are held in memory even when the
+    Hamiltonian is given as a generator (see nonidentity_terms).
+
     Args:
-        hamiltonian: PauliSum Hamiltonian H
+        hamiltonian: PauliSum Hamiltonian H, or an iterable of (coeff, x_mask, z_mask) terms
         qubits: Qubits to evolve
         ppr_instance: PPR object for applying rotations
         time: Total evolution time t
@@ -86,20 +226,40 @@ def first_order_trotter(
     """
     dt = time / num_trotter_steps
 
+    terms = nonidentity_terms(hamiltonian)
+
+    # If all terms commute the evolution is exact, so all steps fuse into one
+    if _commuting_run(terms) == len(terms):
+        _apply_rotation_terms(_rotation_terms(terms, time), qubits, ppr_instance)
+        return
+
+    # Rotation angles, masks and PPR frames are the same for every step, extract them once
+    terms = _rotation_terms(terms, dt)
+
     for _ in range(num_trotter_steps):
-        apply_hamiltonian_as_pprs(hamiltonian, qubits, ppr_instance, dt)
+        _apply_rotation_terms(terms, qubits, ppr_instance)
 
 
 def second_order_trotter(
-    hamiltonian: PauliSum, qubits: Qubits, ppr_instance, time: float, num_trotter_steps: int
+    hamiltonian: PauliSum | Iterable[tuple[float, int, int]],
+    qubits: Qubits,
+    ppr_instance,
+    time: float,
+    num_trotter_steps: int,
 ) -> None:
     """
     Second-order Trotter-Suzuki decomposition
 
-    This uses symmetric splitting (forward then backward) for better accuracy
+    This uses symmetric splitting (forward then backward) for better accuracy.
+    Adjacent applications of the same commuting group are fused into a single
+    rotation per term, i.e. the last group between the forward and backward
+    sweep and the first group between consecutive steps.
+
+    All steps apply the same terms, so they are held in memory even when the
+    Hamiltonian is given as a generator (see nonidentity_terms).
 
     Args:
-        hamiltonian: PauliSum Hamiltonian H
+        hamiltonian: PauliSum Hamiltonian H, or an iterable of (coeff, x_mask, z_mask) terms
         qubits: Qubits to evolve
         ppr_instance: PPR object for applying rotations
         time: Total evolution time t
@@ -108,22 +268,75 @@ def second_order_trotter(
     # Time step is t/(2N) because we apply forward and backward each step
     dt = time / (2 * num_trotter_steps)
 
-    for _ in range(num_trotter_steps):
-        # Forward sweep: P₁, P₂, ..., Pₘ
-        apply_hamiltonian_as_pprs(hamiltonian, qubits, ppr_instance, dt)
+    terms = nonidentity_terms(hamiltonian)
+
+    # If all terms commute the evolution is exact, so all sweeps fuse into one
+    num_first, num_last = _fused_groups(terms)
+    if num_first == len(terms):
+        _apply_rotation_terms(_rotation_terms(terms, time), qubits, ppr_instance)
+        return
+
+    num_middle = len(terms) - num_first - num_last
+
+    # Rotation angles, masks and PPR frames are the same for every step, extract them once
+    frames = _ppr_frames(terms)
+    first = _rotation_terms(terms[:num_first], dt, frames)
+    first_fused = _rotation_terms(terms[:num_first], 2 * dt, frames)
+    middle = _rotation_terms(terms[num_first : num_first + num_middle], dt, frames)
+    middle_reversed = middle[::-1]
+    last_fused = _rotation_terms(terms[num_first + num_middle :], 2 * dt, frames)
+
+    _apply_rotation_terms(first, qubits, ppr_instance)
+
+    for step in range(num_trotter_steps):
+        # Forward sweep: P₂, ..., Pₘ₋₁ and Pₘ fused with the backward sweep
+        _apply_rotation_terms(middle, qubits, ppr_instance)
+        _apply_rotation_terms(last_fused, qubits, ppr_instance)
+
+        # Backward sweep: Pₘ₋₁, ..., P₂
+        _apply_rotation_terms(middle_reversed, qubits, ppr_instance)
+
+        # P₁ of this backward sweep fused with the next forward sweep
+        if step < num_trotter_steps - 1:
+            _apply_rotation_terms(first_fused, qubits, ppr_instance)
+        else:
+            _apply_rotation_terms(first, qubits, ppr_instance)
+
+
+def second_order_rotation_count(
+    hamiltonian: PauliSum | Iterable[tuple[float, int, int]], num_trotter_steps: int
+) -> int:
+    """
+    Number of PPR operations applied by second_order_trotter
+
+    Without fusion this would be 2·M·N for M terms and N steps. Fusing the first group
+    (size F) across steps and the last group (size L) across sweeps gives (2M - F - L)·N + F.
+
+    Args:
+        hamiltonian: PauliSum Hamiltonian H, or an iterable of (coeff, x_mask, z_mask) terms
+        num_trotter_steps: Number of Trotter steps N
+    """
+    terms = nonidentity_terms(hamiltonian)
+    num_first, num_last = _fused_groups(terms)
+    if num_first == len(terms):
+        return len(terms)
 
-        # Backward sweep: Pₘ, ..., P₂, P₁
-        apply_hamiltonian_as_pprs_reversed(hamiltonian, qubits, ppr_instance, dt)
+    return (2 * len(terms) - num_first - num_last) * num_trotter_steps + num_first
 
 
 def trotter_evolution(
-    hamiltonian: PauliSum, qubits: Qubits, ppr_instance, time: float, num_trotter_steps: int, order: int = 2
+    hamiltonian: PauliSum | Iterable[tuple[float, int, int]],
+    qubits: Qubits,
+    ppr_instance,
+    time: float,
+    num_trotter_steps: int,
+    order: int = 2,
 ) -> None:
     """
     General Trotter evolution
 
     Args:
-        hamiltonian: PauliSum Hamiltonian
+        hamiltonian: PauliSum Hamiltonian, or an iterable of (coeff, x_mask, z_mask) terms
         qubits: Qubits to evolve
         ppr_instance: PPR object
         time: Total evolution time